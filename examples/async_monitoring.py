@@ -0,0 +1,94 @@
+"""
+Example: Concurrent Agent Monitoring with AgentOps
+Overlap independent LLM calls with asyncio instead of serializing them
+"""
+
+import agentops
+import asyncio
+from openai import AsyncOpenAI
+
+# Initialize AgentOps monitoring
+agentops.init(
+    api_key="demo_key",
+    project_name="customer_support_agent_async"
+)
+
+# Async LLM client — one instance reused across calls
+client = AsyncOpenAI()
+
+
+@agentops.record_action(action_type="support_chat")
+async def support_agent(user_message: str) -> str:
+    """
+    Simple customer support agent
+    Automatically monitored by AgentOps (async-aware decorator)
+    """
+    response = await client.chat.completions.create(
+        model="gpt-4",
+        messages=[
+            {"role": "system", "content": "You are a helpful customer support agent."},
+            {"role": "user", "content": user_message}
+        ]
+    )
+
+    return response.choices[0].message.content
+
+
+@agentops.record_action(action_type="intent_classification")
+async def classify_intent(message: str) -> str:
+    """Classify user intent (monitored separately)"""
+    response = await client.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": "Classify intent: billing, technical, or general"},
+            {"role": "user", "content": message}
+        ]
+    )
+
+    return response.choices[0].message.content
+
+
+async def main():
+    print("🤖 Starting Async Customer Support Agent Demo\n")
+
+    # Simulate customer interactions
+    test_messages = [
+        "I need help with my bill",
+        "How do I reset my password?",
+        "Your service is down!",
+        "Can I upgrade my plan?",
+        "Thanks for your help!"
+    ]
+
+    print("Processing messages...\n")
+
+    for msg in test_messages:
+        print(f"User: {msg}")
+
+        # Classification and response are independent — run them
+        # concurrently so wall-clock cost is max(t1, t2), not t1 + t2
+        try:
+            intent, response = await asyncio.gather(
+                classify_intent(msg),
+                support_agent(msg)
+            )
+            print(f"Intent: {intent}")
+            print(f"Agent: {response[:100]}...")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+
+        print("-" * 50)
+
+    # Get monitoring stats
+    print("\n📊 Monitoring Stats:")
+    stats = agentops.get_stats()
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+
+    # Export events for analysis
+    agentops.export_events("agent_events_async.json")
+    print("\n✅ Demo completed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
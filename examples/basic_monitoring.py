@@ -4,6 +4,8 @@ This example shows how to monitor a simple AI agent
 """
 
 import agentops
+import json
+from functools import lru_cache
 from openai import OpenAI
 import time
 
@@ -17,35 +19,108 @@ agentops.init(
 client = OpenAI()
 
 
-@agentops.record_action(action_type="support_chat")
-def support_agent(user_message: str) -> str:
+@lru_cache(maxsize=1024)
+def cached_completion(model: str, system_prompt: str, user_message: str) -> str:
     """
-    Simple customer support agent
-    Automatically monitored by AgentOps
+    Memoized chat completion: repeated messages ("Thanks for your
+    help!") hit the cache in microseconds instead of re-paying a
+    network round-trip
     """
     response = client.chat.completions.create(
-        model="gpt-4",
+        model=model,
         messages=[
-            {"role": "system", "content": "You are a helpful customer support agent."},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
     )
-    
+
     return response.choices[0].message.content
 
 
+@agentops.record_action(action_type="support_chat")
+def support_agent(user_message: str) -> str:
+    """
+    Simple customer support agent
+    Automatically monitored by AgentOps
+    """
+    return cached_completion(
+        "gpt-4",
+        "You are a helpful customer support agent.",
+        user_message
+    )
+
+
 @agentops.record_action(action_type="intent_classification")
 def classify_intent(message: str) -> str:
     """Classify user intent (monitored separately)"""
+    return cached_completion(
+        "gpt-3.5-turbo",
+        "Classify intent: billing, technical, or general",
+        message
+    )
+
+
+# Single tool that returns both outputs at once — one round-trip
+# instead of separate classify + respond calls
+RESPOND_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "respond",
+        "description": "Classify the user's intent and answer them",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "intent": {
+                    "type": "string",
+                    "enum": ["billing", "technical", "general"]
+                },
+                "response": {
+                    "type": "string",
+                    "description": "The support answer for the user"
+                }
+            },
+            "required": ["intent", "response"]
+        }
+    }
+}
+
+
+@lru_cache(maxsize=1024)
+def cached_fused_completion(user_message: str) -> tuple[str, str]:
+    """Memoized fused completion — repeated messages skip the network
+    round-trip entirely"""
     response = client.chat.completions.create(
-        model="gpt-3.5-turbo",
+        model="gpt-4",
         messages=[
-            {"role": "system", "content": "Classify intent: billing, technical, or general"},
-            {"role": "user", "content": message}
-        ]
+            {
+                "role": "system",
+                "content": (
+                    "You are a helpful customer support agent. "
+                    "Classify the user's intent (billing, technical, or "
+                    "general) and answer them in one shot."
+                )
+            },
+            {"role": "user", "content": user_message}
+        ],
+        tools=[RESPOND_TOOL],
+        tool_choice={"type": "function", "function": {"name": "respond"}}
     )
-    
-    return response.choices[0].message.content
+
+    call = response.choices[0].message.tool_calls[0]
+    args = json.loads(call.function.arguments)
+    return args["intent"], args["response"]
+
+
+@agentops.record_action(action_type="fused_support")
+def handle_message(user_message: str) -> tuple[str, str]:
+    """
+    Fused support agent: classifies intent and answers in a single
+    chat completion via function calling, halving latency and tokens
+    versus calling classify_intent + support_agent back to back.
+    The cache sits inside the monitored call, so cache hits still
+    record an event — with microsecond latency.
+    """
+    return cached_fused_completion(user_message)
 
 
 def main():
@@ -64,18 +139,15 @@ def main():
     
     for msg in test_messages:
         print(f"User: {msg}")
-        
-        # Classify intent
-        intent = classify_intent(msg)
-        print(f"Intent: {intent}")
-        
-        # Get support response
+
+        # One fused call classifies intent and answers together
         try:
-            response = support_agent(msg)
+            intent, response = handle_message(msg)
+            print(f"Intent: {intent}")
             print(f"Agent: {response[:100]}...")
         except Exception as e:
             print(f"❌ Error: {e}")
-        
+
         print("-" * 50)
         time.sleep(1)  # Simulate real-time processing
     
@@ -20,18 +20,27 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
     ],
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     install_requires=[
         "openai>=1.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "numpy>=1.24.0",
+        ],
+        "upload": [
+            "httpx>=0.24.0",
+        ],
+        "compress": [
+            "zstandard>=0.21.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
@@ -3,139 +3,595 @@ AgentOps - Monitoring for AI Agents
 Core SDK for tracking agent behavior in production
 """
 
+import io
+import logging
+import os
+import reprlib
+import shutil
 import time
 import json
-import hashlib
+import queue
+import secrets
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from functools import wraps
 import asyncio
 
+try:
+    import orjson  # C-accelerated JSON writer; optional
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import numpy as np  # vectorized latency stats; optional
+except ImportError:
+    np = None
+
+try:
+    import httpx  # persistent-connection telemetry uploads; optional
+except ImportError:
+    httpx = None
+
+try:
+    import zstandard as zstd  # compressed exports; optional
+except ImportError:
+    zstd = None
+
+
+logger = logging.getLogger("agentops")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+# ISO-prefix cache keyed by whole second: events within the same second
+# share everything up to the fractional part, so strftime runs once per
+# second of data instead of once per event
+_ts_cache = (0, "")
+
+
+def _format_iso(ts: float) -> str:
+    """Format an epoch timestamp as ISO-8601 with microseconds"""
+    global _ts_cache
+    sec = int(ts)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((ts - sec) * 1e6):06d}"
+
+
+# Bounded repr for captured call arguments — keeps metadata cost O(1)
+# even when args contain full prompts
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = 200
+_arg_repr.maxother = 200
+
+
+@dataclass(slots=True)
 class AgentEvent:
     """Represents a single agent action/monitoring event"""
-    timestamp: str
+    timestamp: float  # epoch seconds; formatted to ISO only at export
     action_type: str
     latency_ms: float
     token_usage: Dict[str, int]
     model: str
     success: bool
     error_message: Optional[str] = None
-    session_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
-    
+
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat literal instead of asdict() — avoids the recursive
+        # deep-copy walk on every serialized event. session_id is
+        # invariant across a monitor, so it lives in the export header
+        # rather than on every record.
+        return {
+            "timestamp": self.timestamp,
+            "action_type": self.action_type,
+            "latency_ms": self.latency_ms,
+            "token_usage": self.token_usage,
+            "model": self.model,
+            "success": self.success,
+            "error_message": self.error_message,
+            "metadata": self.metadata,
+        }
 
 
 class AgentMonitor:
     """Main monitoring class for tracking agent behavior"""
     
-    def __init__(self, api_key: Optional[str] = None, project_name: str = "default"):
+    # Durable-log batching: flush once per FLUSH_BATCH events or
+    # FLUSH_INTERVAL seconds, whichever comes first
+    FLUSH_BATCH = 256
+    FLUSH_INTERVAL = 0.1
+
+    # Ring-buffer capacity for in-memory events; oldest events are
+    # evicted beyond this so long-running agents stay at constant memory
+    MAX_EVENTS = 100_000
+
+    # Drift detection: exponentially-weighted latency average, sampled
+    # every DRIFT_CHECK_EVERY events, alerts rate-limited to one/minute
+    EWMA_ALPHA = 0.01
+    DRIFT_CHECK_EVERY = 100
+    DRIFT_ALERT_INTERVAL = 60.0
+
+    # Telemetry uploads: one POST per UPLOAD_BATCH events or
+    # UPLOAD_INTERVAL seconds over a persistent connection; the circuit
+    # breaker opens after consecutive failures and recovers after a
+    # cool-down so a dead backend can't stall the worker
+    UPLOAD_BATCH = 100
+    UPLOAD_INTERVAL = 2.0
+    BREAKER_FAILURES = 10
+    BREAKER_RECOVERY = 300.0
+
+    # Producer-side queue bound: if the worker falls this far behind,
+    # new events are dropped (and counted) rather than blocking the
+    # caller — telemetry must never stall the agent
+    QUEUE_CAPACITY = 10_000
+
+    def __init__(self, api_key: Optional[str] = None, project_name: str = "default",
+                 log_path: Optional[str] = None, endpoint: Optional[str] = None):
         self.api_key = api_key
         self.project_name = project_name
+        self.log_path = log_path
+        self.endpoint = endpoint
         self.session_id = self._generate_session_id()
-        self.events: list = []
+        self.events: deque = deque(maxlen=self.MAX_EVENTS)
+        self.overflow_count = 0  # events evicted from the ring buffer
         self.baseline_stats: Dict[str, Any] = {}
         self.drift_threshold = 0.2  # 20% change triggers alert
-        
+
+        # Running aggregates maintained by the worker — get_stats never
+        # has to iterate the event buffer
+        self._total = 0
+        self._success_count = 0
+        self._latency_sum = 0.0
+        self._ewma_latency: Optional[float] = None
+        self._last_drift_alert = 0.0
+        self._baseline_deadline: Optional[float] = None
+        self._baseline_min_events = 0
+
+        # Structure-of-arrays latency ring: percentiles come from one
+        # vectorized pass over a float32 array instead of walking
+        # event objects
+        if np is not None:
+            self._lat_ring = np.zeros(self.MAX_EVENTS, np.float32)
+            self._lat_idx = 0
+            self._lat_filled = False
+
+        # Durable-log failure tracking (worker thread only)
+        self.log_write_failures = 0  # events dropped from the durable log
+        self._last_log_error = 0.0
+
+        # Upload circuit breaker state (worker thread only)
+        self._upload_client = None
+        self._upload_failures = 0
+        self._breaker_opened_at: Optional[float] = None
+
+        # Events flow through a bounded queue to a background worker so
+        # the caller's thread never pays for aggregation or drift checks
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_CAPACITY)
+        self.dropped_events = 0  # events discarded because the queue was full
+        self._stats_snapshot: Dict[str, Any] = {}
+        self._worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"agentops-worker-{self.session_id}",
+            daemon=True,
+        )
+        self._worker.start()
+
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
-        timestamp = str(time.time())
-        return hashlib.md5(timestamp.encode()).hexdigest()[:12]
-    
+        return secrets.token_hex(6)
+
     def record_event(self, event: AgentEvent):
-        """Record a monitoring event"""
-        event.session_id = self.session_id
-        self.events.append(event)
-        
-        # Check for drift if we have baseline
-        if self.baseline_stats:
-            self._check_drift(event)
-    
-    def _check_drift(self, event: AgentEvent):
-        """Check if agent behavior has drifted from baseline"""
+        """Record a monitoring event (non-blocking, handled by worker)
+
+        If the worker has fallen QUEUE_CAPACITY events behind, the
+        event is dropped and counted — recording never blocks the
+        caller.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped_events += 1  # GIL-protected int increment
+
+    def _worker_loop(self):
+        """Drain the event queue: append, aggregate, drift-check, log,
+        and upload"""
+        pending: list = []  # events awaiting a durable-log flush
+        first_enqueue = 0.0
+        upload_pending: list = []  # events awaiting a telemetry upload
+        first_upload = 0.0
+
+        while True:
+            # Wake up in time to honor the nearest batch deadline even
+            # if the queue stays quiet
+            deadlines = []
+            if pending:
+                deadlines.append(first_enqueue + self.FLUSH_INTERVAL)
+            if upload_pending:
+                deadlines.append(first_upload + self.UPLOAD_INTERVAL)
+            if deadlines:
+                remaining = min(deadlines) - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    item = None
+            else:
+                item = self._queue.get()
+
+            if isinstance(item, threading.Event):
+                # Flush marker from flush(): everything queued before it
+                # has now been processed. Only the durable log is forced
+                # out — uploads stay on their own batch/interval
+                # deadlines so a caller polling get_stats() can't defeat
+                # upload batching or stall on a slow backend.
+                try:
+                    self._flush_pending(pending)
+                finally:
+                    pending = []
+                    item.set()
+                continue
+
+            try:
+                if item is not None:
+                    if len(self.events) == self.MAX_EVENTS:
+                        self.overflow_count += 1
+                    self.events.append(item)
+                    self._total += 1
+                    self._success_count += item.success
+                    self._latency_sum += item.latency_ms
+                    if np is not None:
+                        self._lat_ring[self._lat_idx] = item.latency_ms
+                        self._lat_idx += 1
+                        if self._lat_idx == self.MAX_EVENTS:
+                            self._lat_idx = 0
+                            self._lat_filled = True
+                    if self._ewma_latency is None:
+                        self._ewma_latency = item.latency_ms
+                    else:
+                        self._ewma_latency += self.EWMA_ALPHA * (
+                            item.latency_ms - self._ewma_latency)
+                    if self.log_path:
+                        if not pending:
+                            first_enqueue = time.monotonic()
+                        pending.append(item)
+                    if httpx is not None and self.endpoint:
+                        if not upload_pending:
+                            first_upload = time.monotonic()
+                        upload_pending.append(item)
+
+                    if self._baseline_deadline is not None:
+                        self._maybe_snapshot_baseline()
+
+                    # Sample drift on the smoothed latency, not per event
+                    if (self.baseline_stats and
+                            self._total % self.DRIFT_CHECK_EVERY == 0):
+                        self._check_drift()
+
+                    self._stats_snapshot = self._compute_stats()
+
+                if pending and (len(pending) >= self.FLUSH_BATCH or
+                                time.monotonic() - first_enqueue >= self.FLUSH_INTERVAL):
+                    self._flush_pending(pending)
+                    pending = []
+
+                if upload_pending and (
+                        len(upload_pending) >= self.UPLOAD_BATCH or
+                        time.monotonic() - first_upload >= self.UPLOAD_INTERVAL):
+                    self._upload_batch(upload_pending)
+                    upload_pending = []
+            except Exception:
+                # The worker must survive anything: a failure processing
+                # one event is logged and the loop keeps draining
+                logger.exception("AgentOps worker error; continuing")
+
+    def _header_dict(self) -> Dict[str, Any]:
+        """Session-invariant fields written once per output, not once
+        per event"""
+        return {"session_id": self.session_id, "project": self.project_name}
+
+    def _flush_pending(self, pending: list):
+        """Append a batch of events to the durable log in one write
+
+        Like uploads, log writes are best-effort: an unwritable path or
+        a transient error (e.g. a full disk) drops the batch and is
+        counted, never killing the worker — the in-memory buffer and
+        stats keep working regardless.
+        """
+        if not pending or not self.log_path:
+            return
+        try:
+            with open(self.log_path, 'ab', buffering=0) as raw:
+                with io.BufferedWriter(raw, buffer_size=65536) as f:
+                    if raw.tell() == 0:
+                        f.write(_dumps(self._header_dict()))
+                        f.write(b'\n')
+                    f.write(b'\n'.join(_dumps(self._export_dict(e)) for e in pending))
+                    f.write(b'\n')
+                    f.flush()
+                    os.fsync(raw.fileno())
+        except Exception as e:
+            self.log_write_failures += len(pending)
+            now = time.monotonic()
+            if now - self._last_log_error >= self.DRIFT_ALERT_INTERVAL:
+                self._last_log_error = now
+                logger.warning(
+                    "Dropped %d events from the durable log (%s)",
+                    len(pending), e)
+
+    def _upload_batch(self, batch: list):
+        """POST a batch of events to the backend (worker thread only)
+
+        Uploads are best-effort: failures never reach the caller, and
+        after BREAKER_FAILURES consecutive errors the circuit opens and
+        batches are discarded until BREAKER_RECOVERY elapses, so a dead
+        backend costs nothing but the counter check.
+        """
+        if not batch or httpx is None or not self.endpoint:
+            return
+
+        now = time.monotonic()
+        if self._breaker_opened_at is not None:
+            if now - self._breaker_opened_at < self.BREAKER_RECOVERY:
+                return  # circuit open: drop the batch
+            self._breaker_opened_at = None  # half-open: probe with this batch
+
+        if self._upload_client is None:
+            # Persistent client so the TLS handshake is paid once, not
+            # per batch
+            self._upload_client = httpx.Client(timeout=5.0)
+
+        payload = dict(self._header_dict())
+        payload["events"] = [self._export_dict(e) for e in batch]
+        headers = {"content-type": "application/json"}
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+
+        try:
+            response = self._upload_client.post(
+                self.endpoint, content=_dumps(payload), headers=headers)
+            response.raise_for_status()
+            self._upload_failures = 0
+        except Exception as e:
+            self._upload_failures += 1
+            if self._upload_failures >= self.BREAKER_FAILURES:
+                self._breaker_opened_at = now
+                self._upload_failures = 0
+                logger.warning(
+                    "Telemetry circuit opened after repeated upload "
+                    "failures (%s); retrying in %.0fs", e,
+                    self.BREAKER_RECOVERY)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all queued events have been processed"""
+        marker = threading.Event()
+        try:
+            # Unlike record_event, the marker may wait for a slot: the
+            # caller asked to synchronize, so blocking briefly is fine
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def _check_drift(self):
+        """Check if smoothed latency has drifted from baseline
+
+        Compares the EWMA against the baseline so one slow outlier
+        can't fire an alert, and rate-limits alerts to one per minute.
+        """
         baseline_latency = self.baseline_stats.get('avg_latency', 0)
-        if baseline_latency > 0:
-            latency_change = abs(event.latency_ms - baseline_latency) / baseline_latency
-            if latency_change > self.drift_threshold:
-                print(f"⚠️  DRIFT ALERT: Latency changed by {latency_change:.1%}")
-                print(f"   Baseline: {baseline_latency:.0f}ms | Current: {event.latency_ms:.0f}ms")
+        if baseline_latency <= 0 or self._ewma_latency is None:
+            return
+        latency_change = abs(self._ewma_latency - baseline_latency) / baseline_latency
+        if latency_change > self.drift_threshold:
+            now = time.monotonic()
+            if now - self._last_drift_alert >= self.DRIFT_ALERT_INTERVAL:
+                self._last_drift_alert = now
+                logger.warning(
+                    "DRIFT ALERT: Latency changed by %.1f%% "
+                    "(baseline: %.0fms | current EWMA: %.0fms)",
+                    latency_change * 100, baseline_latency, self._ewma_latency)
     
-    def record_action(self, action_type: str = "agent_action"):
-        """Decorator to automatically monitor agent actions"""
+    def _record_call(self, action_type: str, capture_args: bool,
+                     start_time: float, start_ns: int, success: bool,
+                     error_msg: Optional[str], args: tuple, kwargs: dict):
+        """Build and enqueue the event for one monitored call"""
+        latency = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        # Extract token usage if available in result
+        token_usage = {"prompt": 0, "completion": 0, "total": 0}
+
+        if capture_args:
+            metadata = {"args_repr": _arg_repr.repr(args),
+                        "kwargs_repr": _arg_repr.repr(kwargs)}
+        else:
+            metadata = None
+
+        event = AgentEvent(
+            timestamp=start_time,
+            action_type=action_type,
+            latency_ms=latency,
+            token_usage=token_usage,
+            model="unknown",  # Override in specific implementations
+            success=success,
+            error_message=error_msg,
+            metadata=metadata
+        )
+
+        self.record_event(event)
+
+    # Wrapper body generated per decorated function. Constants
+    # (action_type, metadata capture, sync vs async) are baked in at
+    # decoration time and the hot names are bound in the exec namespace,
+    # so each call skips the closure-cell and attribute lookups a
+    # generic wrapper would pay — the same trick attrs and dataclasses
+    # use for generated __init__ methods.
+    _WRAPPER_SRC = """\
+{adef} wrapper(*args, **kwargs):
+    start_time = _wall()
+    start_ns = _pc()
+    success = True
+    error_msg = None
+    try:
+        return {await_}_func(*args, **kwargs)
+    except Exception as e:
+        success = False
+        error_msg = str(e)
+        raise
+    finally:
+        _record({action_type!r}, {capture_args!r}, start_time, start_ns,
+                success, error_msg, args, kwargs)
+"""
+
+    def record_action(self, action_type: str = "agent_action",
+                      capture_args: bool = False):
+        """Decorator to automatically monitor agent actions
+
+        Works on both plain functions and coroutine functions; async
+        callables get an async wrapper so awaited time is measured
+        without blocking the event loop.
+
+        Argument capture is opt-in: stringifying args can be O(prompt
+        size) when wrapping LLM calls, so it is skipped by default.
+        """
         def decorator(func: Callable):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                start_time = time.time()
-                success = True
-                error_msg = None
-                
-                try:
-                    result = func(*args, **kwargs)
-                    return result
-                except Exception as e:
-                    success = False
-                    error_msg = str(e)
-                    raise
-                finally:
-                    latency = (time.time() - start_time) * 1000
-                    
-                    # Extract token usage if available in result
-                    token_usage = {"prompt": 0, "completion": 0, "total": 0}
-                    
-                    event = AgentEvent(
-                        timestamp=datetime.now().isoformat(),
-                        action_type=action_type,
-                        latency_ms=latency,
-                        token_usage=token_usage,
-                        model="unknown",  # Override in specific implementations
-                        success=success,
-                        error_message=error_msg,
-                        metadata={"args": str(args), "kwargs": str(kwargs)}
-                    )
-                    
-                    self.record_event(event)
-                    
-            return wrapper
+            is_async = asyncio.iscoroutinefunction(func)
+            src = self._WRAPPER_SRC.format(
+                adef="async def" if is_async else "def",
+                await_="await " if is_async else "",
+                action_type=action_type,
+                capture_args=capture_args,
+            )
+            ns = {
+                "_wall": time.time,
+                "_pc": time.perf_counter_ns,
+                "_func": func,
+                "_record": self._record_call,
+            }
+            exec(src, ns)
+            return wraps(func)(ns["wrapper"])
         return decorator
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get monitoring statistics"""
-        if not self.events:
-            return {"message": "No events recorded yet"}
-        
-        total_events = len(self.events)
-        success_count = sum(1 for e in self.events if e.success)
-        avg_latency = sum(e.latency_ms for e in self.events) / total_events
-        
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Build a stats dict from the running aggregates — O(1)"""
         return {
-            "total_events": total_events,
-            "success_rate": success_count / total_events,
-            "avg_latency_ms": avg_latency,
+            "total_events": self._total,
+            "success_rate": self._success_count / self._total,
+            "avg_latency_ms": self._latency_sum / self._total,
+            "dropped_events": self.dropped_events,
             "session_id": self.session_id,
             "project": self.project_name
         }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get monitoring statistics from the worker's latest snapshot
+
+        When numpy is installed the stats also include latency
+        percentiles over the buffered events, computed in one
+        vectorized pass over the latency ring.
+        """
+        self.flush()
+        if not self._stats_snapshot:
+            return {"message": "No events recorded yet"}
+        stats = dict(self._stats_snapshot)
+        if np is not None and (self._lat_idx or self._lat_filled):
+            view = self._lat_ring if self._lat_filled \
+                else self._lat_ring[:self._lat_idx]
+            p50, p95, p99 = np.percentile(view, [50, 95, 99])
+            stats["p50_latency_ms"] = float(p50)
+            stats["p95_latency_ms"] = float(p95)
+            stats["p99_latency_ms"] = float(p99)
+        return stats
+
+    def establish_baseline(self, duration_seconds: int = 300,
+                           min_events: int = 10):
+        """Arm baseline collection for drift detection
+
+        Returns immediately; the worker snapshots the baseline once the
+        sampling window has elapsed and at least min_events have been
+        recorded. Until then the agent keeps running unmonitored for
+        drift.
+        """
+        self._baseline_deadline = time.monotonic() + duration_seconds
+        self._baseline_min_events = min_events
+        print(f"📊 Establishing baseline over the next {duration_seconds}s...")
+
+    def _maybe_snapshot_baseline(self):
+        """Snapshot baseline stats once the armed window is satisfied
+        (worker thread only)"""
+        if (self._baseline_deadline is None or
+                time.monotonic() < self._baseline_deadline or
+                self._total < self._baseline_min_events):
+            return
+        self._baseline_deadline = None
+        self.baseline_stats = {
+            'avg_latency': self._latency_sum / self._total,
+            'avg_tokens': 0,  # Calculate from events
+            'event_count': self._total
+        }
+        logger.info("Baseline established: %s", self.baseline_stats)
     
-    def establish_baseline(self, duration_seconds: int = 300):
-        """Establish baseline behavior for drift detection"""
-        print(f"📊 Establishing baseline for {duration_seconds}s...")
-        time.sleep(duration_seconds)  # In real impl, this would monitor continuously
-        
-        if self.events:
-            self.baseline_stats = {
-                'avg_latency': sum(e.latency_ms for e in self.events) / len(self.events),
-                'avg_tokens': 0,  # Calculate from events
-                'event_count': len(self.events)
-            }
-            print(f"✅ Baseline established: {self.baseline_stats}")
-    
-    def export_events(self, filepath: str):
-        """Export events to JSON for analysis"""
-        with open(filepath, 'w') as f:
-            json.dump([e.to_dict() for e in self.events], f, indent=2)
+    @staticmethod
+    def _export_dict(event: AgentEvent) -> Dict[str, Any]:
+        """Serializable form of an event, with the ISO timestamp
+        materialized only here rather than on the hot path"""
+        d = event.to_dict()
+        d["timestamp"] = _format_iso(event.timestamp)
+        return d
+
+    def export_events(self, filepath: str, compress: bool = False):
+        """Export events as newline-delimited JSON for analysis
+
+        Events are streamed one line at a time, so peak memory stays
+        constant regardless of how many are buffered, and the output
+        can be tailed or processed line-by-line downstream.
+
+        With compress=True (and zstandard installed) the stream is
+        piped through a zstd writer to <filepath>.zst — repeated keys
+        and action types make event logs compress extremely well.
+        """
+        self.flush()
+        if compress:
+            if zstd is None:
+                logger.warning(
+                    "zstandard not installed; exporting uncompressed")
+            else:
+                filepath += '.zst'
+                with open(filepath, 'wb') as raw:
+                    cctx = zstd.ZstdCompressor(level=3)
+                    with cctx.stream_writer(raw) as cw:
+                        if self.log_path and os.path.exists(self.log_path):
+                            with open(self.log_path, 'rb') as log:
+                                shutil.copyfileobj(log, cw, 65536)
+                        else:
+                            cw.write(_dumps(self._header_dict()))
+                            cw.write(b'\n')
+                            for e in self.events:
+                                cw.write(_dumps(self._export_dict(e)))
+                                cw.write(b'\n')
+                print(f"📁 Events exported to {filepath}")
+                return
+
+        if self.log_path and os.path.exists(self.log_path):
+            # Durable log already holds every event as NDJSON; copy it
+            shutil.copyfile(self.log_path, filepath)
+        else:
+            with open(filepath, 'wb', buffering=0) as raw:
+                with io.BufferedWriter(raw, buffer_size=65536) as f:
+                    f.write(_dumps(self._header_dict()))
+                    f.write(b'\n')
+                    for e in self.events:
+                        f.write(_dumps(self._export_dict(e)))
+                        f.write(b'\n')
         print(f"📁 Events exported to {filepath}")
 
 
@@ -143,19 +599,30 @@ class AgentMonitor:
 _monitor: Optional[AgentMonitor] = None
 
 
-def init(api_key: Optional[str] = None, project_name: str = "default") -> AgentMonitor:
+def init(api_key: Optional[str] = None, project_name: str = "default",
+         log_path: Optional[str] = None,
+         endpoint: Optional[str] = None) -> AgentMonitor:
     """Initialize AgentOps monitoring"""
     global _monitor
-    _monitor = AgentMonitor(api_key=api_key, project_name=project_name)
+    _monitor = AgentMonitor(api_key=api_key, project_name=project_name,
+                            log_path=log_path, endpoint=endpoint)
+
+    # Rebind the module-level helpers to the monitor's bound methods so
+    # later calls skip the "is it initialized" branch and the global
+    # _monitor lookup entirely
+    globals()["record_action"] = _monitor.record_action
+    globals()["get_stats"] = _monitor.get_stats
+    globals()["export_events"] = _monitor.export_events
+
     print(f"🔍 AgentOps initialized | Project: {project_name} | Session: {_monitor.session_id}")
     return _monitor
 
 
-def record_action(action_type: str = "agent_action"):
+def record_action(action_type: str = "agent_action", capture_args: bool = False):
     """Decorator to record agent actions"""
     if _monitor is None:
         raise RuntimeError("AgentOps not initialized. Call agentops.init() first.")
-    return _monitor.record_action(action_type)
+    return _monitor.record_action(action_type, capture_args=capture_args)
 
 
 def get_stats() -> Dict[str, Any]:
@@ -165,8 +632,8 @@ def get_stats() -> Dict[str, Any]:
     return _monitor.get_stats()
 
 
-def export_events(filepath: str):
+def export_events(filepath: str, compress: bool = False):
     """Export events to file"""
     if _monitor is None:
         raise RuntimeError("AgentOps not initialized")
-    _monitor.export_events(filepath)
+    _monitor.export_events(filepath, compress=compress)